@@ -5,118 +5,246 @@ A proper call to these functions is included in the update_all script.
 import airtable as at
 import doi_resolver as dr
 import os
-from pybtex.database.input import bibtex
+from concurrent.futures import ThreadPoolExecutor
+import re
 import time
 
 bibtex_translator = str.maketrans('', '', '\\{}')
 # textquotesingle
 
+# matches the "@type{key," opening of a bibtex entry
+bib_entry_re = re.compile(r'@(\w+)\s*\{\s*([^,\s]+)\s*,')
+# matches a "field =" introducer; the value itself is read with a brace scan
+bib_field_re = re.compile(r'\s*(\w+)\s*=\s*')
+
+# latex escape sequences that show up in fetched titles; unknown ones are dropped
+latex_escape_re = re.compile(r'\{\\[A-Za-z]+\}')
+latex_escape_map = {'{\\Textquotesingle}': "'", '{\\Textemdash}': '-'}
+
+# Airtable allows at most 10 records per write request and 5 requests per second,
+# so we coalesce per-field updates into one fields dict per record and flush
+# the records in chunks of 10 with a short pause between chunks.
+BATCH_SIZE = 10
+BATCH_PAUSE = 0.2
+
+# how many doi/citation lookups to keep in flight at once,
+# matching the Crossref polite-pool limit of 10 requests per second
+MAX_FETCHERS = 10
+
 user_key = os.environ['AIRTABLE_API_KEY']
 table_name = 'papers_mass'
 table_base = 'appBzOSifwBqSuVfH'
 
 table = at.Airtable(table_base, table_name, user_key)
-records = table.get_all()
 
-for record in records:
-    title = record['fields'].get('Title', '')
-    title_clean1 = title.replace('{\Textquotesingle}', "'")
-    title_clean2 = title_clean1.replace('{\Textemdash}', "-")
-    title_clean3 = title_clean2.translate(bibtex_translator).lower().title()
-    table.update(record['id'], {'Title': title_clean3})
+
+def clean_titles():
+    """Normalize bibtex escape sequences in all paper titles.
+    Previously this ran at module scope, so merely importing the module fetched
+    and rewrote the whole table; now it only runs when explicitly invoked.
+    """
+    title_updates = []
+    for record in table.get_all():
+        title = record['fields'].get('Title', '')
+        # resolve all latex escapes in one substitution pass, then strip \{} leftovers
+        title_clean = latex_escape_re.sub(lambda m: latex_escape_map.get(m.group(), ''), title)
+        title_clean = title_clean.translate(bibtex_translator).lower().title()
+        title_updates.append({'id': record['id'], 'fields': {'Title': title_clean}})
+    table.batch_update(title_updates)
 
 
 def update_paper_table():
-    for record in records:
-        if 'Modified' in record['fields']:
-            fill_paper(record)
+    # let Airtable filter on the Modified flag server-side instead of
+    # downloading the whole table and dropping most of the rows here;
+    # fill_paper only reads the doi and bibtex source fields
+    modified = table.get_all(formula="NOT({Modified} = '')", fields=['doi', 'bibtexfull'])
+    # the doi and citation-count lookups for different records are independent
+    # network calls, so we overlap them instead of waiting on each in turn
+    with ThreadPoolExecutor(max_workers=MAX_FETCHERS) as executor:
+        filled = list(executor.map(fill_paper, modified))
+
+    pending = []
+    for record, fields in zip(modified, filled):
+        if fields:
+            pending.append({'id': record['id'], 'fields': fields})
+        if len(pending) == BATCH_SIZE:
+            table.batch_update(pending)
+            pending = []
+            time.sleep(BATCH_PAUSE)
+    if len(pending) > 0:
+        table.batch_update(pending)
 
 
 def fill_paper(record):
+    """Collect all updated field values for a single paper record.
+
+    Args:
+        record: which record to fill
+
+    Returns:
+        dict: all field values to be written back, to be sent in one request
+
+    """
+    fields = {}
     # if doi present
     if 'doi' in record['fields']:
         doi = record['fields']['doi']
 
         # fill in bibtex
         bib = dr.doi2bib(doi)
-        airtable.update(record['id'], {'bibtexfull': bib})
+        fields['bibtexfull'] = bib
 
         # fill in citation count
         citations = dr.doi2count(doi)
-        airtable.update(record['id'], {'num_citations': int(citations)})
+        fields['num_citations'] = int(citations)
 
         # fill in bibliographic information
-        fill_bibliography(record)
+        fields.update(fill_bibliography(bib))
 
     elif 'bibtexfull' in record['fields']:
         # fill in bibliographic information
-        fill_bibliography(record)
+        fields.update(fill_bibliography(record['fields']['bibtexfull']))
 
     else:
         print("This paper record has neither doi nor bibtex specified.")
 
-    time.sleep(5)
+    return fields
+
 
+def parse_bibtex(bib_string):
+    """Extract the entry type, citation key and top-level fields from a bibtex string.
+    We only ever read a handful of plain fields (title, author, year, journal...),
+    so a full pybtex parse with name parsing and LaTeX decoding is wasted work here.
 
-def fill_bibliography(record):
-    bib_string = record['fields']['bibtexfull']
+    Args:
+        bib_string: full bibtex entry for a paper
+
+    Returns:
+        tuple: entry type (str), citation key (str), fields (dict) keyed by lowercase name
+
+    """
+    entry = bib_entry_re.search(bib_string)
+    bib_type = entry.group(1).lower()
+    key = entry.group(2)
+
+    fields = {}
+    pos = entry.end()
+    while True:
+        m = bib_field_re.match(bib_string, pos)
+        if m is None:
+            break
+        name = m.group(1).lower()
+        i = m.end()
+        if i >= len(bib_string):
+            break
+        if bib_string[i] == '{':
+            # values can contain nested braces (e.g. {A {B} title}), so scan for balance;
+            # jump between braces with str.find rather than stepping one character at a time
+            depth = 1
+            j = i + 1
+            while depth > 0:
+                open_brace = bib_string.find('{', j)
+                close_brace = bib_string.find('}', j)
+                if close_brace == -1:
+                    j = len(bib_string)
+                    break
+                if open_brace != -1 and open_brace < close_brace:
+                    depth += 1
+                    j = open_brace + 1
+                else:
+                    depth -= 1
+                    j = close_brace + 1
+            fields[name] = bib_string[i + 1:j - 1].strip()
+        elif bib_string[i] == '"':
+            j = bib_string.find('"', i + 1)
+            fields[name] = bib_string[i + 1:j].strip()
+            j += 1
+        else:
+            # bare values like year = 2019 run to the next comma or closing brace
+            j = i
+            while j < len(bib_string) and bib_string[j] not in ',}':
+                j += 1
+            fields[name] = bib_string[i:j].strip()
+        comma = bib_string.find(',', j)
+        if comma == -1:
+            break
+        pos = comma + 1
+
+    return bib_type, key, fields
+
+
+def last_name(author):
+    """Return the last name from a single bibtex author string
+    (either "Last, First" or "First Last")."""
+    if ',' in author:
+        return author.split(',')[0].strip()
+    else:
+        return author.split()[-1]
+
+
+def fill_bibliography(bib_string):
+    """Parse a bibtex string and collect the bibliographic fields it provides.
+
+    Args:
+        bib_string: full bibtex entry for a paper
+
+    Returns:
+        dict: bibliographic field values keyed by Airtable column names
+
+    """
+    fields = {}
 
     # fill in citation data
-    parser = bibtex.Parser()
-    bib_data = parser.parse_string(bib_string)
-    k = bib_data.entries.keys()[0]
+    bib_type, k, bib_fields = parse_bibtex(bib_string)
     print(k)
-    bib_type = bib_data.entries[k].type
-    airtable.update(record['id'], {'Publication_type': bib_type})
+    fields['Publication_type'] = bib_type
 
-    authors_list = [p.__str__() for p in bib_data.entries[k].persons['author']]
+    authors_list = [a.strip() for a in bib_fields.get('author', '').split(' and ') if a.strip()]
     authors = "; ".join(authors_list)
-    airtable.update(record['id'], {'Authors': authors})
+    fields['Authors'] = authors
 
-    year = bib_data.entries[k].fields.get('year', '')
-    airtable.update(record['id'], {'Year': year})
+    year = bib_fields.get('year', '')
+    fields['Year'] = year
 
-    title = bib_data.entries[k].fields['title']
-    airtable.update(record['id'], {'Title': title})
+    title = bib_fields['title']
+    fields['Title'] = title
 
     if bib_type == "article":
-        journal = bib_data.entries[k].fields['journal']
-        airtable.update(record['id'], {'Journal': journal})
-        volume = bib_data.entries[k].fields.get('volume', '')
-        airtable.update(record['id'], {'Vol': volume})
-        number = bib_data.entries[k].fields.get('number', '')
-        airtable.update(record['id'], {'Num': number})
-        pages = bib_data.entries[k].fields.get('pages', '')
-        airtable.update(record['id'], {'Pages': pages})
+        journal = bib_fields['journal']
+        fields['Journal'] = journal
+        volume = bib_fields.get('volume', '')
+        fields['Vol'] = volume
+        number = bib_fields.get('number', '')
+        fields['Num'] = number
+        pages = bib_fields.get('pages', '')
+        fields['Pages'] = pages
 
     elif bib_type == "incollection":
-        book = bib_data.entries[k].fields['booktitle']
-        airtable.update(record['id'], {'Book_title': book})
-        pages = bib_data.entries[k].fields.get('pages', '')
-        airtable.update(record['id'], {'Pages': pages})
+        book = bib_fields['booktitle']
+        fields['Book_title'] = book
+        pages = bib_fields.get('pages', '')
+        fields['Pages'] = pages
 
     elif bib_type == "techreport":
-        institution = bib_data.entries[k].fields.get('institution', '')
-        airtable.update(record['id'], {'Institution': institution})
+        institution = bib_fields.get('institution', '')
+        fields['Institution'] = institution
 
     # nothing to add for book and misc
 
     # create parencite
-    first_author = bib_data.entries[k].persons['author'][0].last_names[0]
-
     if len(authors_list) == 0:
         parencite = ""
     elif len(authors_list) == 1:
-        parencite = "({}, '{})".format(first_author, year[-2:])
+        parencite = "({}, '{})".format(last_name(authors_list[0]), year[-2:])
     elif len(authors_list) == 2:
-        second_author = bib_data.entries[k].persons['author'][1].last_names[0]
-        parencite = "({} & {}, '{})".format(first_author, second_author[0], year[-2:])
+        second_author = last_name(authors_list[1])
+        parencite = "({} & {}, '{})".format(last_name(authors_list[0]), second_author[0], year[-2:])
     else:
-        parencite = "({} ea, '{})".format(first_author, year[-2:])
+        parencite = "({} ea, '{})".format(last_name(authors_list[0]), year[-2:])
 
-    airtable.update(record['id'], {'parencite': parencite})
+    fields['parencite'] = parencite
 
-    time.sleep(1)
+    return fields
 
 
 def format_citation(record):
@@ -196,5 +324,10 @@ for r in records:
 for r in records:
     fill_paper(r)
 for r in records:
-    fill_bibliography(r) 
+    fill_bibliography(r)
 """
+
+
+if __name__ == '__main__':
+    clean_titles()
+    update_paper_table()
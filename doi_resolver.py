@@ -1,7 +1,51 @@
+import functools
+import re
 import requests
+import shelve
+import threading
+import time
 from habanero import counts
 from habanero import Crossref
 
+# strips everything but lowercase letters and digits in one C-level pass
+nonalnum_re = re.compile(r'[^a-z0-9]+')
+
+# identifying ourselves puts requests in Crossref's polite pool
+# (higher rate limit and priority routing)
+crossref = Crossref(mailto="admin@innovationsinfundraising.org",
+                    ua_string="fundingwiki/1.0")
+
+# responses are deterministic per DOI/title, so cache them on disk between runs;
+# citation counts drift over time and get refreshed weekly
+cache_file = '.doi_cache'
+count_expiry = 7 * 24 * 3600
+cache_lock = threading.Lock()
+
+
+def disk_memoize(expire=None):
+    """Cache a function's return value on disk, keyed by its name and arguments.
+    This keeps reruns over the same papers from re-hitting Crossref/dx.doi.org.
+
+    Args:
+        expire: lifetime of a cached value in seconds (None means never expires)
+
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args):
+            key = repr((fn.__name__,) + args)
+            with cache_lock, shelve.open(cache_file) as cache:
+                if key in cache:
+                    value, stored = cache[key]
+                    if expire is None or time.time() - stored < expire:
+                        return value
+            value = fn(*args)
+            with cache_lock, shelve.open(cache_file) as cache:
+                cache[key] = (value, time.time())
+            return value
+        return wrapper
+    return decorator
+
 # import scholar.scholar as sch
 #
 # querier = sch.ScholarQuerier()
@@ -10,6 +54,8 @@ from habanero import Crossref
 # querier.apply_settings(settings)
 
 
+@functools.lru_cache(maxsize=None)
+@disk_memoize()
 def doi2bib(doi):
     """ Return a bibTeX string of metadata for a given DOI."""
 
@@ -21,18 +67,29 @@ def doi2bib(doi):
     return r.text
 
 
+@functools.lru_cache(maxsize=None)
+@disk_memoize(expire=count_expiry)
 def doi2count(doi):
     return counts.citation_count(doi=doi)
 
 
+@functools.lru_cache(maxsize=None)
+@disk_memoize()
 def title2doi(title):
     title = title.lower()
-    clean_title = ''.join(e for e in title if e.isalnum())
-    cr = Crossref()
-    res = cr.works(query_title=title, select="title,DOI", limit=5)
+    clean_title = nonalnum_re.sub('', title)
+    # the top hit is almost always the right one, so ask for a single row first
+    # and only fall back to a wider query when its title does not match exactly
+    res = crossref.works(query_title=title, select="title,DOI", limit=1)
+    items = res['message']['items']
+    if len(items) > 0:
+        fetched_title = items[0]['title'][0].lower()
+        if nonalnum_re.sub('', fetched_title) == clean_title:
+            return items[0]['DOI']
+    res = crossref.works(query_title=title, select="title,DOI", limit=5)
     for r in res['message']['items']:
         fetched_title = r['title'][0].lower()
-        clean_fetched = ''.join(e for e in fetched_title if e.isalnum())
+        clean_fetched = nonalnum_re.sub('', fetched_title)
         if clean_fetched == clean_title:
             return r['DOI']
 
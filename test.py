@@ -1,9 +1,21 @@
+"""
+Quick manual check that the configured wiki is reachable: fetch and print one page.
+Credentials come from config.json and the environment, same as in the wikimanager.
+"""
 import json
 import os
 import dokuwiki as dw
 
-with open('config.json', 'r') as f:
-    config = json.load(f)
-wiki = dw.DokuWiki(config['official']["wiki_url"], "david", "321con")
-p = wiki.pages.get('tables:papers')
-print(p)
+
+def main(version='official'):
+    with open('config.json', 'r') as f:
+        config = json.load(f)
+    wiki = dw.DokuWiki(config[version]["wiki_url"],
+                       config[version]["username"],
+                       os.environ[config[version]["password_key"]])
+    p = wiki.pages.get('tables:papers')
+    print(p)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,17 @@
 This is a top-level script for maintaining all the tables and pages on Innovations in Fundraising Wiki.
 """
 import wikimanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+def update_one(table_name):
+    """Refresh a single table and its pages.
+    Each worker builds its own manager because setup_table keeps the active
+    table as manager state.
+    """
+    manager = wikimanager.WikiManager("official")
+    manager.setup_table(table_name)
+    manager.update_table_pages()
 
 
 def main():
@@ -13,11 +24,15 @@ def main():
         manager.setup_table(table)
         manager.update_table_source()
 
-    for table in defined_tables:
-        manager.setup_table(table)
-        manager.update_table_pages()
+    # the per-table builds are independent and network-bound, so run a few side by side;
+    # collect each build's outcome so a failing table is reported rather than lost
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        builds = {executor.submit(update_one, table): table for table in defined_tables}
+        for future in as_completed(builds):
+            if future.exception() is not None:
+                print("Updating table {} failed: {}".format(builds[future], future.exception()))
 
 
 if __name__ == '__main__':
     main()
-    print("Update complete")
\ No newline at end of file
+    print("Update complete")
@@ -1,61 +1,271 @@
 """
 Define functions and classes for representing Airtable data, manipulating it and redirecting it to the Wiki
 in different formats (as tables or pages).
+
+Note on performance: the build pipeline is dominated by Airtable and DokuWiki
+network I/O, so the row/page formatting deliberately stays plain CPython.
+Keep CPU-side work to joined strings, precompiled regexes and cached
+translations; JIT or native compilation (e.g. Numba) buys nothing here and
+would not handle these dict-of-dict records anyway.
 """
 # noinspection PyPackageRequirements
 import airtable as at
-from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
+import hashlib
+import re
+import shelve
 import string
+import threading
 import time
 import doi_resolver as dr
 from pybtex.database.input import bibtex
 import json
-from collections import OrderedDict
+from collections import deque, OrderedDict
+from itertools import chain
 
 
 # define a punctuation stripper for using later in pagename constructors
 punctuation_translator = str.maketrans('', '', string.punctuation)
 bibtex_translator = str.maketrans('', '', '\\{}')
+# turn newlines into DW line breaks and drop carriage returns in one scan
+newline_translator = str.maketrans({'\n': ' \\\\ ', '\r': None})
+
+# one pooled adapter mounted on every Airtable client's session: the pool is
+# owned by the adapter, so all clients share keep-alive connections to
+# api.airtable.com instead of each paying its own TLS handshake, and
+# transient failures (including 429 rate limiting) retry with backoff
+airtable_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20,
+                               max_retries=Retry(total=5, backoff_factor=0.5,
+                                                 status_forcelist=[429, 500, 502, 503, 504]))
+
+
+@lru_cache(maxsize=None)
+def get_airtable(base_name, table_name, user_key):
+    """Return a shared Airtable client for a given base and table.
+    Each client owns a requests session, so reusing one per (base, table)
+    keeps the HTTP connection alive instead of paying a new TCP/TLS
+    handshake whenever another object connects to the same table.
+
+    Args:
+        base_name (str): API key to the Airtable base
+        table_name (str): the name of the table in the base
+        user_key (str): user API key to the Airtable
+
+    Returns:
+        Airtable: the shared client
+
+    """
+    client = at.Airtable(base_name, table_name, user_key)
+    client.session.mount('https://', airtable_adapter)
+    return client
+
+
+@lru_cache(maxsize=2048)
+def clean_journal_name(name):
+    """Strip bibtex markup from a journal name and title-case it.
+    str.title already lowercases non-initial letters, so one translate plus
+    one title call covers what used to be three chained passes; the same
+    journals recur across papers, hence the cache.
+
+    Args:
+        name (str): journal name as it appears in the bibtex
+
+    Returns:
+        str: the cleaned, title-cased name
+
+    """
+    return name.translate(bibtex_translator).title()
+
+
+@lru_cache(maxsize=8192)
+def make_page_name(label):
+    """Strip punctuation from a label to form a DW page name.
+    The same labels come up over and over (papers shared between tools,
+    tools shared between papers), so cache the translation per label.
+
+    Args:
+        label (str): the display label of a record
+
+    Returns:
+        str: the label with all punctuation removed
+
+    """
+    return label.translate(punctuation_translator)
+
+
+@lru_cache(maxsize=1)
+def load_tabledefs():
+    """Parse tabledef.json once per run.
+    Every Table constructor used to re-open and re-parse the file; the
+    definitions do not change while the script runs, so all instances can
+    share one parsed dict.
+
+    Returns:
+        dict: column definitions for all defined tables
+
+    """
+    with open('tabledef.json', 'r') as f:
+        return json.load(f)
+
+
+# the source tables change rarely compared to how often the build runs, so
+# get_all results are also kept on disk between runs (same idea as the
+# .doi_cache shelf in doi_resolver): within the TTL a rebuild reads the
+# pickled records instead of re-paginating the whole table over HTTPS.
+# Record updates are delayed by at most the TTL; lower it if that matters.
+airtable_cache_file = '.airtable_cache'
+airtable_cache_ttl = 3600.0
+airtable_cache_lock = threading.Lock()
+
+
+def cached_get_all(airtable, refresh=False, **query):
+    """Fetch all records of a table, reusing an on-disk copy while it is fresh.
+    Results are keyed by the table URL and the query (fields, formula), so
+    different projections of the same table are cached independently.
+
+    Args:
+        airtable: airtable object to fetch through
+        refresh: bypass the cached copy and refetch; callers whose decisions
+            depend on live data (e.g. the Modified flags the update drivers
+            scan) must not be served a snapshot. The fresh result still
+            replaces the cached one.
+        **query: keyword arguments passed on to get_all
+
+    Returns:
+        list: Airtable table records
+
+    """
+    key = hashlib.md5(repr((airtable.url_table, sorted(query.items()))).encode('utf-8')).hexdigest()
+    if not refresh:
+        with airtable_cache_lock, shelve.open(airtable_cache_file) as cache:
+            entry = cache.get(key)
+        if entry is not None and time.time() - entry[0] < airtable_cache_ttl:
+            return entry[1]
+    records = airtable.get_all(**query)
+    with airtable_cache_lock, shelve.open(airtable_cache_file) as cache:
+        cache[key] = (time.time(), records)
+    return records
+
+
+def clear_airtable_cache():
+    """Drop all cached get_all results, e.g. after writing records back."""
+    with airtable_cache_lock, shelve.open(airtable_cache_file) as cache:
+        cache.clear()
+
+
+@lru_cache(maxsize=None)
+def get_table_index(airtable, fields):
+    """Download a linked table once and index the requested fields by record id.
+    Linked records used to be resolved with one .get() round trip per id, which
+    dominated table builds; a single projected get_all replaces all of them
+    with in-memory lookups for the rest of the run.
+
+    Args:
+        airtable: airtable object for the linked table
+        fields (tuple): the column names the callers will read
+
+    Returns:
+        dict: record fields keyed by record id
+
+    """
+    return {r['id']: r['fields'] for r in cached_get_all(airtable, fields=list(fields))}
+
+
+@lru_cache(maxsize=4096)
+def get_record(airtable, record_id):
+    """Fetch a single record and remember it for repeated lookups.
+    The bulk get_table_index covers linked lookups in normal operation; this
+    is the fallback for ids that are missing from an index (e.g. records
+    added after it was built), so only the first such lookup pays the
+    network round-trip and later ones are served from the cache.
+
+    Args:
+        airtable: airtable object to fetch through
+        record_id: id of the linked record
+
+    Returns:
+        dict: the fetched record
+
+    """
+    return airtable.get(record_id)
 
 
 def insert_check(value, record):
-    if value not in record['fields']:
-        return ""
-    else:
-        return u'\u2713'
+    return u'\u2713' if value in record['fields'] else ""
 
 
 def make_external_link(record, link_name, label_type, label_name):
-    link = record['fields'].get(link_name, '')
+    # bind the fields dict once instead of probing record['fields'] per access
+    fields = record['fields']
+    # one probe covers both the missing and the empty link
+    link = fields.get(link_name)
 
     if label_type == 'field':
-        label = record['fields'].get(label_name, '')
-        if link != '':
+        label = fields.get(label_name, '')
+        if link:
             return '[[{}|{}]]'.format(link, label)
         else:
             return label
     else:
-        if link != '':
+        if link:
             return '[[{}|{}]]'.format(link, label_name)
         else:
             return ''
 
 
 def make_internal_link(record, label_name, namespace, replacement_label_name):
+    fields = record['fields']
     # fetch the column whose value will be displayed in the link
-    label = record['fields'].get(label_name, '')
+    label = fields.get(label_name, '')
     # the label will be used to create a DW page name and we have to remove all punctuation for this purpose
     # (because a web link cannot have punctuation marks on DW)
-    page_name = label.translate(punctuation_translator)
+    page_name = make_page_name(label)
     # create a DW link to that page
     if replacement_label_name is None:
         link = '[[{}:{}|{}]]'.format(namespace, page_name, label)
     else:
-        replacement_label = record['fields'][replacement_label_name]
+        replacement_label = fields[replacement_label_name]
         link = '[[{}:{}|{}]]'.format(namespace, page_name, replacement_label)
     return link
 
 
+def link_source_columns(columndefs):
+    """Collect every column name a set of column definitions reads from a record.
+    Internal and External link columns are synthesized from other fields (the
+    label, its replacement and the URL), which are not columndef keys
+    themselves; a fetch projection built from the keys alone leaves those
+    fields out, so the links render empty and records get dropped whenever the
+    main column is such a source field (as 'parencite' is on the paper tables).
+
+    Args:
+        columndefs: column definitions from tabledef.json
+
+    Returns:
+        set: column names to include in the fetch projection
+
+    """
+    columns = set(columndefs)
+    for v in columndefs.values():
+        for target_format in ('table', 'page'):
+            vf = v.get(target_format)
+            if vf is None:
+                continue
+            if v['type'] == "Internal link":
+                if vf.get('label'):
+                    columns.add(vf['label'])
+                if vf.get('replacement_label'):
+                    columns.add(vf['replacement_label'])
+            elif v['type'] == "External link":
+                if vf.get('URL'):
+                    columns.add(vf['URL'])
+                if vf.get('label_type') == 'field':
+                    columns.add(vf['label'])
+    return columns
+
+
 def get_linked_items(airtable, column_name, record, linked_column_name):
     """Fetch linked item names from a given column in a given record.
     This is used when a table we are using has a column in which records are not natively present
@@ -63,7 +273,7 @@ def get_linked_items(airtable, column_name, record, linked_column_name):
     This function looks up these records and retrieves information from a specified column in their table.
 
     Args:
-        airtable: airtable object associated with the table
+        airtable: airtable object for the linked table the ids point at
         column_name: the name of the column that contains linked item ids
         record: which record to fetch for
         linked_column_name: the name of the column in a linked table that we use to retrieve meaningful item names
@@ -72,28 +282,44 @@ def get_linked_items(airtable, column_name, record, linked_column_name):
         str: joined item names
 
     """
-    if column_name in record['fields']:
-        item_ids = record['fields'][column_name]
-        item_names = [airtable.get(item_id)['fields'][linked_column_name] for item_id in item_ids]
-        items = ', '.join(item_names)
-    else:
-        items = ''
+    item_ids = record['fields'].get(column_name, [])
+    if len(item_ids) == 0:
+        return ''
+    linked_by_id = get_table_index(airtable, (linked_column_name,))
+    item_names = []
+    for item_id in item_ids:
+        linked_fields = linked_by_id.get(item_id)
+        if linked_fields is None:
+            # ids can point at records added after the index was built (or
+            # served from a stale snapshot), so fall back to a single fetch
+            # instead of crashing the whole page build
+            linked_fields = get_record(airtable, item_id)['fields']
+        item_names.append(linked_fields.get(linked_column_name, ''))
+    items = ', '.join(item_names)
     return items
 
 
-def get_paper_links(airtable, paper_ids, label, fulltext):
+def get_paper_links(airtable, papers_by_id, paper_ids, label, fulltext):
     # This function is used when we need to link to paper pages from outside the paper table
     # This can appear as [[paper_title | paper_title]] or [[paper_title | parencite]]
     # and additionally can have an external link to full text
+    # papers_by_id is a pre-fetched index of paper fields keyed by record id,
+    # so normally no network calls happen per paper here; airtable is the
+    # papers table client used to fetch ids the index does not cover
     papers = []
     # create links only if there are papers in the table for a given tool
     if len(paper_ids) > 0:
         for paper_id in paper_ids:
-            p_title = airtable.get(paper_id)['fields'].get('Title', '')
-            p_parencite = airtable.get(paper_id)['fields'].get('parencite', '')
+            paper_fields = papers_by_id.get(paper_id)
+            if paper_fields is None:
+                # same late-added-record fallback as in get_linked_items: the
+                # index can come from a snapshot that predates this paper
+                paper_fields = get_record(airtable, paper_id)['fields']
+            p_title = paper_fields.get('Title', '')
+            p_parencite = paper_fields.get('parencite', '')
             # paper pages use paper Titles for their web address and main heading
             # web addresses do not have punctuation
-            paper_page_name = p_title.translate(punctuation_translator)
+            paper_page_name = make_page_name(p_title)
             # create a DW link to paper page
             # the label that links to that page can be Title or parencite
             if label == 'title':
@@ -104,8 +330,8 @@ def get_paper_links(airtable, paper_ids, label, fulltext):
                 paper_page = ''
 
             if fulltext:
-                p_url = airtable.get(paper_id)['fields'].get('URL', '')
-                if p_url != '':
+                p_url = paper_fields.get('URL')
+                if p_url:
                     # we also link to paper full text when available
                     fulltext_link = '[[{}|Full text]]'.format(p_url)
                     paper_page += ', ' + fulltext_link
@@ -118,19 +344,26 @@ def get_tool_links(airtable, tool_ids):
     related_tools = []
     # create links only if there are papers in the table for a given tool
     if len(tool_ids) > 0:
+        tools_by_id = get_table_index(airtable, ('Tool name',))
         for tool_id in tool_ids:
-            tool_name = airtable.get(tool_id)['fields'].get('Tool name', '')
-            tool_page_name = tool_name.translate(punctuation_translator)
+            tool_fields = tools_by_id.get(tool_id)
+            if tool_fields is None:
+                # same late-added-record fallback as in get_linked_items
+                tool_fields = get_record(airtable, tool_id)['fields']
+            tool_name = tool_fields.get('Tool name', '')
+            tool_page_name = make_page_name(tool_name)
             tool_dw_table_page = '[[tools:{}|{}]]'.format(tool_page_name, tool_name)
             related_tools.append(tool_dw_table_page)
     return related_tools
 
 
 def make_bullets(bullet_items):
-    if len(bullet_items) > 0:
-        return '\n\n  * ' + '\n\n  * '.join(filter(None, bullet_items)) + '\n'
-    else:
+    # filter before deciding whether to emit anything, so a list holding only
+    # empty strings renders as no bullets instead of one empty bullet
+    items = [item for item in bullet_items if item]
+    if len(items) == 0:
         return ''
+    return '\n\n  * ' + '\n\n  * '.join(items) + '\n'
 
 
 def format_value(coltype, value):
@@ -153,28 +386,180 @@ def format_value(coltype, value):
 
     if value == "":
         return ""
-    else:
-        if coltype in ["Single line text", "Long text", "Single select", "Date", "Phone number", "Email", "URL"]:
-            return value.strip().replace('\n', ' \\\\ ').replace('\r', '')
-        # TODO "Duration" is returned in seconds and should be converted
-        elif coltype in ["Number", "Currency", "Percent", "Duration", "Rating"]:
-            return str(value)
-        elif coltype in ["Multiple select", "Lookup"]:
-            return ", ".join(value)
-        elif coltype == "Checkbox":
-            return u'\u2713'
-        elif coltype == "Single collaborator":
-            return value["name"]
-        elif coltype == "Multiple collaborator":
-            return ", ".join(v["name"] for v in value)
-        elif coltype == "Attachment":
-            # we assume for now that all attachments are pictures
-            return "{{" + value[0]["url"] + "?400}}\n"
-        elif coltype in ["Link to another record", "External link", "Internal link", "Raw"]:
-            return value
-        else:
-            print("Column type '{}' unrecognized".format(coltype))
-            return ""
+    formatter = value_formatters.get(coltype)
+    if formatter is None:
+        print("Column type '{}' unrecognized".format(coltype))
+        return ""
+    return formatter(value)
+
+
+def _format_text(value):
+    return value.strip().translate(newline_translator)
+
+
+def _format_passthrough(value):
+    return value
+
+
+def _format_attachment(value):
+    # we assume for now that all attachments are pictures
+    return "{{" + value[0]["url"] + "?400}}\n"
+
+
+# format_value runs once per cell per record, so dispatch through one dict
+# lookup instead of walking an if/elif chain that rebuilt its list literals
+# on every call
+# TODO "Duration" is returned in seconds and should be converted
+value_formatters = {
+    "Checkbox": lambda value: u'\u2713',
+    "Single collaborator": lambda value: value["name"],
+    "Multiple collaborator": lambda value: ", ".join(v["name"] for v in value),
+    "Attachment": _format_attachment,
+}
+for _coltype in ("Single line text", "Long text", "Single select", "Date", "Phone number", "Email", "URL"):
+    value_formatters[_coltype] = _format_text
+for _coltype in ("Number", "Currency", "Percent", "Duration", "Rating"):
+    value_formatters[_coltype] = str
+for _coltype in ("Multiple select", "Lookup"):
+    value_formatters[_coltype] = ", ".join
+for _coltype in ("Link to another record", "External link", "Internal link", "Raw"):
+    value_formatters[_coltype] = _format_passthrough
+del _coltype
+
+
+def fill_template(template, replacements):
+    """Replace every placeholder in a page template in a single pass.
+    The page templates live on the wiki and use uppercase placeholders, so we
+    substitute them with one compiled regex instead of rebuilding the whole
+    template string once per placeholder.
+
+    Args:
+        template (str): page template with uppercase placeholders
+        replacements: pairs of (placeholder, value)
+
+    Returns:
+        str: the template with all placeholders substituted
+
+    """
+    values = dict(replacements)
+    return placeholder_pattern(tuple(values)).sub(lambda m: values[m.group(0)], template)
+
+
+@lru_cache(maxsize=64)
+def placeholder_pattern(placeholders):
+    """Compile the placeholder alternation for a given placeholder set.
+    The set of placeholders is fixed per table, so every page of a table
+    reuses the same compiled pattern instead of rebuilding it per record.
+    Longer placeholders come first in the alternation: some are prefixes of
+    others (PAPERS/PAPERS2, MATCH/MATCH_DETAILS) and the regex engine takes
+    the first alternative that matches, not the longest."""
+    ordered = sorted(placeholders, key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in ordered))
+
+
+# page builds are rerun even when nothing changed on the Airtable side, so we
+# keep a small shelf of digests of the page bodies we last posted and skip any
+# write whose content is unchanged (and with it the rate-limit cost it carries)
+page_digest_file = '.page_digests'
+page_digest_lock = threading.Lock()
+
+
+def page_digest(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def set_page_if_changed(wiki, page_name, content):
+    """Post a page to the wiki unless its content matches what was last posted.
+
+    Args:
+        wiki (DokuWiki): wiki object used to post the page
+        page_name (str): wiki link name of the page
+        content (str): formatted page body
+
+    Returns:
+        bool: whether the page was actually written
+    """
+    digest = page_digest(content)
+    with page_digest_lock, shelve.open(page_digest_file) as digests:
+        if digests.get(page_name) == digest:
+            return False
+    wiki.pages.set(page_name, content)
+    with page_digest_lock, shelve.open(page_digest_file) as digests:
+        digests[page_name] = digest
+    return True
+
+
+class PageBatcher:
+    """
+    Buffer formatted wiki pages and post them through a small thread pool.
+
+    DokuWiki page writes are independent of each other, so instead of posting
+    pages strictly one by one with a long sleep in between, each submitted page
+    is dispatched to a small pool right away, throttled by a token bucket so
+    bursts go through and we only wait when the write budget for the period is
+    actually spent. Earlier pages upload in the background while later ones
+    are still being formatted.
+
+    Attributes:
+        wiki (DokuWiki): wiki object used to post the pages
+        max_workers (int): how many concurrent write connections to use
+        calls (int): how many writes are allowed per period
+        period (float): length of the rate-limiting window, in seconds
+    """
+
+    def __init__(self, wiki, max_workers=4, calls=30, period=60.0):
+        self.wiki = wiki
+        self.max_workers = max_workers
+        self.calls = calls
+        self.period = period
+        self._stamps = deque()
+        self._executor = None
+        self._futures = {}
+        with page_digest_lock, shelve.open(page_digest_file) as digests:
+            self._posted_digests = dict(digests)
+        self._new_digests = {}
+
+    def _wait_for_slot(self):
+        """Block until the rate budget allows another write."""
+        now = time.monotonic()
+        while self._stamps and now - self._stamps[0] > self.period:
+            self._stamps.popleft()
+        if len(self._stamps) >= self.calls:
+            time.sleep(self.period - (now - self._stamps[0]))
+            self._stamps.popleft()
+        self._stamps.append(time.monotonic())
+
+    def submit(self, page_name, content):
+        """Dispatch a single page write as soon as the rate budget allows.
+        Pages whose content matches what was last posted are skipped outright."""
+        digest = page_digest(content)
+        if self._posted_digests.get(page_name) == digest:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._wait_for_slot()
+        self._new_digests[page_name] = digest
+        self._futures[page_name] = self._executor.submit(self.wiki.pages.set, page_name, content)
+
+    def close(self):
+        """Wait for all dispatched writes to finish and remember what landed.
+        Failed posts are reported per page instead of aborting the whole run."""
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True)
+        with page_digest_lock, shelve.open(page_digest_file) as digests:
+            for page_name, future in self._futures.items():
+                if future.exception() is not None:
+                    print("Posting page '{}' failed: {}".format(page_name, future.exception()))
+                else:
+                    digests[page_name] = self._new_digests[page_name]
+        self._executor = None
+        self._futures = {}
+
+
+# formatted table headers keyed by id() of the columndefs dict they were
+# built from; filled lazily by Table.construct_header
+header_cache = {}
 
 
 class Table:
@@ -204,6 +589,19 @@ class Table:
         root_namespace (str): the namespace in which pages will be included
 
     """
+    # per-table constants live at class level: they are the same for every
+    # instance of a given table class, so there is no point reassigning them
+    # in each __init__. Values below are the defaults for tables without a
+    # specific class; subclasses override them in their own class bodies.
+    dw_table_page = 'tables:test'
+    included_in = None
+    main_column = None
+    header = ''
+    linked_pages = True
+    dw_page_template = None
+    dw_page_name_column = None
+    root_namespace = None
+    _records = None
 
     def __init__(self, wiki, base_name, table_name, user_key):
         """Instantiate a Table object.
@@ -217,40 +615,155 @@ class Table:
             user_key (str): user API key to the Airtable
         """
         self.wiki = wiki
-        self.airtable = at.Airtable(base_name, table_name, user_key)
-        self.records = self.airtable.get_all()
-        with open('tabledef.json', 'r') as f:
-            self.tabledefs = json.load(f)
-        self.dw_table_page = 'tables:test'
-        self.included_in = None
-        self.main_column = None
-        self.header = ''
+        # kept so linked_airtable can build clients for the tables that
+        # 'Link to another record' columns point at
+        self.base_name = base_name
+        self.user_key = user_key
+        self.airtable = get_airtable(base_name, table_name, user_key)
+        self.tabledefs = load_tabledefs()
         self.columndefs = self.tabledefs.get(table_name, None)
-        self.linked_pages = True
-        # if the table feeds DW pages
-        if self.linked_pages:
-            self.dw_page_template = None
-            self.dw_page_name_column = None
-            self.root_namespace = None
-
-    @staticmethod
-    def construct_header(columndefs):
-        header = []
-        for k, v in columndefs.items():
-            if v['table']['publish']:
-                header.append((v['table']['pos'], v['table']['header']))
-        header = [h[1] for h in sorted(header, key=lambda x: x[0])]
-        formatted_header = "\n^ " + " ^ ".join(header) + " ^\n"
+        # per-(columndefs, format) display orders, filled lazily by column_plan
+        self._column_plans = {}
+        if self.columndefs is not None:
+            self.prefetch_linked_tables()
+        # records are downloaded lazily through the records property, so a
+        # table that is constructed but never rendered costs no table scan
+
+    @property
+    def records(self):
+        """Table records, downloaded on first access and kept for the run.
+        Subclasses with special fetches (extra columns, formulas, parallel
+        downloads) assign the attribute directly in their constructors."""
+        if self._records is None:
+            self._records = self.fetch_own_records()
+        return self._records
+
+    @records.setter
+    def records(self, value):
+        self._records = value
+
+    def prefetch_linked_tables(self):
+        """Warm the linked-table indexes for all 'Link to another record' columns.
+        get_table_index fills lazily, which would serialize the bulk fetches on
+        the first rendered row; issuing the warm-ups concurrently here means
+        they overlap each other and the rest of the constructor's fetches.
+        Each warm-up targets the table the column's linked_table entry points
+        at. A failed warm-up is reported and not cached, so the first real
+        lookup retries it."""
+        targets = set()
+        for v in self.columndefs.values():
+            if v['type'] == "Link to another record":
+                for target_format in ('table', 'page'):
+                    name = v.get(target_format, {}).get('linked_column_name')
+                    if name:
+                        targets.add((v['linked_table'], name))
+        if len(targets) > 0:
+            with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+                warmups = {
+                    executor.submit(get_table_index,
+                                    get_airtable(self.base_name, linked_table, self.user_key),
+                                    (name,)): linked_table
+                    for linked_table, name in targets}
+            for future, linked_table in warmups.items():
+                if future.exception() is not None:
+                    print("Prefetching linked table '{}' failed: {}".format(linked_table, future.exception()))
+
+    def fetch_records(self, extra_columns=('Modified',), formula=None, refresh=False):
+        """Fetch all table records, restricted to the columns the row and page
+        constructors actually read. Pulling every column of every row also
+        downloads large free-text fields that are never displayed, which
+        inflates both the transfer and the JSON decode.
+
+        Args:
+            extra_columns: control columns needed besides the defined ones
+                (e.g. 'Modified' for update tracking or 'Wiki?' for filtering)
+            formula: optional Airtable formula to filter records server-side
+                instead of downloading rows that would be discarded locally
+            refresh: bypass the on-disk snapshot cache and refetch
+
+        Returns:
+            (list) Airtable table records
+        """
+        if self.columndefs is None:
+            return cached_get_all(self.airtable, refresh=refresh, formula=formula)
+        # the link builders read source fields that are not columndef keys, and
+        # the filter and page-name columns may not be either
+        columns = link_source_columns(self.columndefs)
+        columns.update(extra_columns)
+        for column in (self.main_column, self.dw_page_name_column):
+            if column is not None:
+                columns.add(column)
+        return cached_get_all(self.airtable, refresh=refresh,
+                              fields=sorted(columns), formula=formula)
+
+    def fetch_own_records(self, refresh=False):
+        """Fetch this table's record set with its standard projection and
+        filter; rows without the main column are dropped by Airtable itself
+        rather than downloaded and skipped in iter_rows. Subclasses with
+        special fetches override this, so the update drivers can refetch any
+        table with refresh=True and have their Modified checks see live data
+        instead of a disk snapshot.
+
+        Args:
+            refresh: bypass the on-disk snapshot cache and refetch
+
+        Returns:
+            (list) Airtable table records
+        """
+        formula = None
+        if self.main_column is not None:
+            formula = "NOT({{{}}} = BLANK())".format(self.main_column)
+        return self.fetch_records(formula=formula, refresh=refresh)
+
+    def linked_airtable(self, columndef):
+        """Return the client for the table a linked-record column points at.
+        Linked ids belong to the target table named by the column's
+        linked_table entry in tabledef.json, not to this table, so lookups
+        must go through the target table's client.
+
+        Args:
+            columndef: definition of a 'Link to another record' column
+
+        Returns:
+            Airtable: the shared client for the linked table
+        """
+        return get_airtable(self.base_name, columndef['linked_table'], self.user_key)
+
+    def column_plan(self, columndefs, target_format):
+        """Return the published (column name, definition) pairs in display order.
+        fetch_row used to collect (pos, value) tuples and re-sort them for every
+        record; the order only depends on the column definitions, so it is
+        computed once per definitions-and-format pair and reused.
+
+        Args:
+            columndefs: column definitions from tabledef.json
+            target_format: whether the columns feed a 'table' row or a 'page'
+
+        Returns:
+            (list) published (column name, definition) pairs sorted by position
+        """
+        key = (id(columndefs), target_format)
+        plan = self._column_plans.get(key)
+        if plan is None:
+            published = [(k, v) for k, v in columndefs.items() if v[target_format]['publish']]
+            plan = sorted(published, key=lambda kv: kv[1][target_format]['pos'])
+            self._column_plans[key] = plan
+        return plan
+
+    def construct_header(self, columndefs):
+        # the header depends only on the column definitions, which all
+        # instances share through load_tabledefs, so one build per
+        # definitions dict serves every table constructed this run
+        key = id(columndefs)
+        formatted_header = header_cache.get(key)
+        if formatted_header is None:
+            header = [v['table']['header'] for k, v in self.column_plan(columndefs, 'table')]
+            formatted_header = "\n^ " + " ^ ".join(header) + " ^\n"
+            header_cache[key] = formatted_header
         return formatted_header
 
-    @staticmethod
-    def construct_placeholders(columndefs):
-        keys = []
-        for k, v in columndefs.items():
-            if v['page']['publish']:
-                keys.append((v['page']['pos'], v['page']['placeholder']))
-        keys = [h[1] for h in sorted(keys, key=lambda x: x[0])]
-        return keys
+    def construct_placeholders(self, columndefs):
+        return [v['page']['placeholder'] for k, v in self.column_plan(columndefs, 'page')]
 
     def construct_row(self, record):
         """Construct a single table row for a given record.
@@ -261,34 +774,39 @@ class Table:
         Returns:
             (str) formatted row for the table based on record content
         """
-        row = "| "
-        for key, value in record['fields'].items():
-            row += repr(value)
-            row += " | "
-        row += " |\n"
-        return row
+        cells = ["| "]
+        # bind the append method once; only the values are rendered here
+        append = cells.append
+        for value in record['fields'].values():
+            append(repr(value))
+            append(" | ")
+        append(" |\n")
+        return "".join(cells)
 
     def fetch_row(self, columndefs, record, target_format='table'):
+        # bind the fields dict once instead of probing record['fields'] per column
+        fields = record['fields']
         row = []
-        for k, v in columndefs.items():
-            if v[target_format]['publish']:
-                if v['type'] == "External link":
-                    value = make_external_link(record, v[target_format]["URL"],
-                                               v[target_format]['label_type'],
-                                               v[target_format]['label'])
-                elif v['type'] == "Internal link":
-                    value = make_internal_link(record, v[target_format]['label'],
-                                               v[target_format]['namespace'],
-                                               v[target_format]['replacement_label'])
-                elif v['type'] == "Link to another record":
-                    value = get_linked_items(self.airtable, k, record,
-                                             v[target_format]['linked_column_name'])
-                else:
-                    value = record['fields'].get(k, "")
+        # the plan is already filtered to published columns and sorted by
+        # position, so values can be appended in display order directly
+        for k, v in self.column_plan(columndefs, target_format):
+            vf = v[target_format]
+            if v['type'] == "External link":
+                value = make_external_link(record, vf["URL"],
+                                           vf['label_type'],
+                                           vf['label'])
+            elif v['type'] == "Internal link":
+                value = make_internal_link(record, vf['label'],
+                                           vf['namespace'],
+                                           vf['replacement_label'])
+            elif v['type'] == "Link to another record":
+                value = get_linked_items(self.linked_airtable(v), k, record,
+                                         vf['linked_column_name'])
+            else:
+                value = fields.get(k, "")
 
-                row.append((v[target_format]['pos'], format_value(v['type'], value)))
+            row.append(format_value(v['type'], value))
 
-        row = [v[1] for v in sorted(row, key=lambda x: x[0])]
         return row
 
     def automatic_construct_row(self, record):
@@ -297,38 +815,42 @@ class Table:
 
         return formatted_row
 
-    def format_table(self, page_length=None):
-        """Construct a full table for Airtable table records.
-        Loop through all records and collect all formatted rows.
+    def iter_rows(self):
+        """Generate formatted rows for the records that pass the main-column filter.
+        Rows are produced one at a time, so joining them into a table does not
+        materialize an intermediate list of row strings.
 
-        Returns:
-            (str) formatted table
+        Yields:
+            (str) formatted row
         """
-        if page_length is not None:
-            table_content = '<datatables page-length="{}">\n'.format(page_length)
-        else:
-            table_content = ''
-        # initialize table content with the header
-        table_content += self.header
-        # construct the rows for all available records using the corresponding constructor function
         for record in self.records:
             # we only consider records in which the main column is not empty
             if (self.main_column is not None) and (self.main_column not in record['fields']):
-                pass
+                continue
+            # print(record['fields']['Tool name'])
+            if self.columndefs is None:
+                # this means we haven't defined the table yet
+                yield self.construct_row(record)
             else:
-                # print(record['fields']['Tool name'])
-                if self.columndefs is None:
-                    # this means we haven't defined the table yet
-                    table_content += self.construct_row(record)
-                else:
-                    table_content += self.automatic_construct_row(record)
+                yield self.automatic_construct_row(record)
+
+    def format_table(self, page_length=None):
+        """Construct a full table for Airtable table records.
+        The header, the streamed rows and the optional datatables wrapper are
+        joined in a single linear pass.
+
+        Returns:
+            (str) formatted table
+        """
         if page_length is not None:
-            table_content += '</datatables>\n'
-        return table_content
+            return "".join(chain(['<datatables page-length="{}">\n'.format(page_length), self.header],
+                                 self.iter_rows(),
+                                 ['</datatables>\n']))
+        return "".join(chain([self.header], self.iter_rows()))
 
     def set_table_page(self):
         new_page = self.format_table()
-        self.wiki.pages.set(self.dw_table_page, new_page)
+        set_page_if_changed(self.wiki, self.dw_table_page, new_page)
 
     def create_page(self, record):
         """Construct a default page for a single record.
@@ -339,48 +861,56 @@ class Table:
         Returns:
             (str) a formatted page
         """
-        page = ""
+        parts = []
+        append = parts.append
         for key, value in record['fields'].items():
-            page += key.upper() + "\n\n"
-            page += repr(value) + "\n"
-            page += "\n"
-        return page
+            append(key.upper() + "\n\n")
+            append(repr(value) + "\n")
+            append("\n")
+        return "".join(parts)
 
-    def format_pages(self, records):
-        """Construct pages for all provided records.
+    def iter_pages(self, records):
+        """Generate (wiki link name, page content) pairs for the provided records.
+        Formatting is done lazily, so a consumer can start posting the first
+        pages while the later ones are still being built.
 
         Args:
             records: Airtable records
 
-        Returns:
-            (dict) a set of pages indexed by their wiki link names
+        Yields:
+            (tuple) a wiki link name and the formatted page
         """
-        new_pages = {}
         if (self.main_column is None) and (self.dw_page_name_column is None):
             record = records[0]
-            page_name = 'test:test_page'
-            page = self.create_page(record)
-            new_pages[page_name] = page
+            yield 'test:test_page', self.create_page(record)
         else:
             for record in records:
-                # print(record['fields']['Tool name'])
-                if (self.main_column not in record['fields']) or (self.dw_page_name_column not in record['fields']):
-                    pass
-                else:
-                    page_name = record['fields'][self.dw_page_name_column]
-                    clean_page_name = page_name.translate(punctuation_translator)
-                    full_page_name = self.root_namespace + clean_page_name
-                    page = self.create_page(record)
-                    new_pages[full_page_name] = page
-        return new_pages
+                fields = record['fields']
+                if (self.main_column not in fields) or (self.dw_page_name_column not in fields):
+                    continue
+                page_name = fields[self.dw_page_name_column]
+                clean_page_name = make_page_name(page_name)
+                yield self.root_namespace + clean_page_name, self.create_page(record)
+
+    def format_pages(self, records):
+        """Construct pages for all provided records.
+
+        Args:
+            records: Airtable records
+
+        Returns:
+            (dict) a set of pages indexed by their wiki link names
+        """
+        return dict(self.iter_pages(records))
 
     def set_pages(self):
-        """Format pages for table records and post them to the wiki."""
-        new_pages = self.format_pages(self.records)
-        # this has to be done with a break of at least 5s
-        for page in new_pages:
-            self.wiki.pages.set(page, new_pages[page])
-            time.sleep(5)
+        """Format pages for table records and post them to the wiki.
+        Pages are dispatched as soon as they are formatted, so uploads of
+        earlier pages overlap with the formatting of later ones."""
+        batcher = PageBatcher(self.wiki)
+        for page_name, page in self.iter_pages(self.records):
+            batcher.submit(page_name, page)
+        batcher.close()
 
 
 class ToolTable(Table):
@@ -388,26 +918,57 @@ class ToolTable(Table):
     One of the sub-classes of the Table class that defines a specific format for tables and pages
     based on the Tools table in the Airtable database.
     """
+    dw_table_page = 'tables:tools'  # define where the table will be posted on the Wiki
+    included_in = 'tools:tools'  # define where the table will be actually displayed for the public
+    main_column = 'Tool name'  # which column is the main one
+    # under which namespace the pages will be placed
+    root_namespace = 'tools:'
+    # which column will be used to create a page name (and its location on the Wiki)
+    dw_page_name_column = 'Tool name'
+
     def __init__(self, wiki, base_name, table_name, user_key):
         super(ToolTable, self).__init__(wiki, base_name, table_name, user_key)  # call the top class initialization
-        self.airtable = at.Airtable(base_name, table_name, user_key)  # create connection to the Airtable table
-        self.records = self.airtable.get_all()  # fetch all records
-        self.dw_table_page = 'tables:tools'  # define where the table will be posted on the Wiki
-        self.included_in = 'tools:tools'  # define where the table will be actually displayed for the public
-        self.main_column = 'Tool name'  # which column is the main one
-        # define table header
         self.columndefs = self.tabledefs[table_name]
+        # the tools table and the two linked tables it pre-indexes (categories for
+        # the row pop-overs, papers for the link builder) are independent fetches,
+        # so download all three at the same time instead of back to back
+        categories_airtable = get_airtable(base_name, 'Categories', user_key)
+        papers_airtable = get_airtable(base_name, 'papers_mass', user_key)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            records_fetch = executor.submit(self.fetch_own_records)
+            categories_fetch = executor.submit(cached_get_all, categories_airtable)
+            papers_fetch = executor.submit(cached_get_all, papers_airtable, fields=['Title', 'parencite', 'URL'])
+        self.records = records_fetch.result()  # fetch all records, defined columns only
+        self.categories_by_id = {r['id']: r['fields'] for r in categories_fetch.result()}
+        self.papers_by_id = {r['id']: r['fields'] for r in papers_fetch.result()}
+        # kept for the index-miss fallbacks: the snapshots above can be served
+        # from the on-disk cache and predate records the live tool rows link to
+        self.papers_airtable = papers_airtable
+        self.categories_airtable = categories_airtable
+        # define table header
         self.header = self.construct_header(self.columndefs)
         self.placeholders = self.construct_placeholders(self.columndefs)
-        # specify whether the table also feeds a set of Wiki pages
-        self.linked_pages = True
         # define a Wiki page template; placeholders in uppercase to be replaced with actual data
-        self.root_namespace = 'tools:'
         self.dw_page_template = wiki.pages.get(self.root_namespace+'pagetemplate')
-        # which column will be used to create a page name (and its location on the Wiki)
-        self.dw_page_name_column = 'Tool name'
-        # under which namespace the pages will be placed
-
+        # column positions the row and page builders index into, resolved once
+        # here instead of three chained dict lookups per record
+        self.cat_table_pos = self.columndefs['Category']['table']['pos'] - 1
+        self.key_papers_table_pos = self.columndefs['key_papers']['table']['pos'] - 1
+        self.cat_page_pos = self.columndefs['Category']['page']['pos'] - 1
+        self.key_papers_page_pos = self.columndefs['key_papers']['page']['pos'] - 1
+        self.secondary_papers_page_pos = self.columndefs['secondary papers']['page']['pos'] - 1
+
+    def fetch_own_records(self, refresh=False):
+        # pages are filtered on 'Wiki?', updates on 'Modified'
+        return self.fetch_records(('Wiki?', 'Modified'), refresh=refresh)
+
+    def category_fields(self, cat_id):
+        """Resolve a category record id against the pre-fetched index, with the
+        usual single-fetch fallback for categories the snapshot predates."""
+        fields = self.categories_by_id.get(cat_id)
+        if fields is None:
+            fields = get_record(self.categories_airtable, cat_id)['fields']
+        return fields
 
     def automatic_construct_row(self, record):
         """
@@ -418,24 +979,22 @@ class ToolTable(Table):
         # only consider rows for which 'Wiki?' column is set to True
         if 'Wiki?' in record['fields']:
             row = self.fetch_row(self.columndefs, record)
-            cat_pos = self.columndefs['Category']['table']['pos'] - 1
+            cat_pos = self.cat_table_pos
             category_ids = row[cat_pos]
 
-            # create category pop-overs
-            if len(category_ids) > 0:
-                category_names = [self.airtable.get(cat_id)['fields']['(Sub)Category or theme'] for
-                                  cat_id in category_ids]
-                category_descriptions = [self.airtable.get(cat_id)['fields']['Description'].rstrip() for
-                                         cat_id in category_ids]
-                categories = ["<popover content=\"{}\" trigger='hover'>{}</popover>".format(description, name) for
-                              description in category_descriptions for name in category_names]
-            else:
-                categories = ''
+            # create category pop-overs; pull each category's fields once
+            # instead of indexing the same entry for name and description
+            categories = []
+            for cat_id in category_ids:
+                category_fields = self.category_fields(cat_id)
+                categories.append("<popover content=\"{}\" trigger='hover'>{}</popover>".format(
+                    category_fields['Description'].rstrip(),
+                    category_fields['(Sub)Category or theme']))
 
             row[cat_pos] = ', '.join(categories)
             # papers will also link to their pages, so we need to create those links
-            paper_pos = self.columndefs['key_papers']['table']['pos'] - 1
-            key_papers = get_paper_links(self.airtable, row[paper_pos], 'parencite', False)
+            paper_pos = self.key_papers_table_pos
+            key_papers = get_paper_links(self.papers_airtable, self.papers_by_id, row[paper_pos], 'parencite', False)
             row[paper_pos] = ', '.join(key_papers)
             formatted_row = "| " + " | ".join(row) + " |\n"
         else:
@@ -451,16 +1010,18 @@ class ToolTable(Table):
         """
         variables = self.fetch_row(self.columndefs, record, target_format="page")
 
-        cat_pos = self.columndefs['Category']['page']['pos'] - 1
-        variables[cat_pos] = get_linked_items(self.airtable, 'Category', record, '(Sub)Category or theme')
+        cat_pos = self.cat_page_pos
+        category_ids = record['fields'].get('Category', [])
+        variables[cat_pos] = ', '.join(self.category_fields(cat_id)['(Sub)Category or theme']
+                                       for cat_id in category_ids)
 
         # insert links to relevant papers
-        paper_pos = self.columndefs['key_papers']['page']['pos'] - 1
-        papers = get_paper_links(self.airtable, variables[paper_pos], 'title', True)
+        paper_pos = self.key_papers_page_pos
+        papers = get_paper_links(self.papers_airtable, self.papers_by_id, variables[paper_pos], 'title', True)
         variables[paper_pos] = make_bullets(papers)
 
-        secondary_pos = self.columndefs['secondary papers']['page']['pos'] - 1
-        secondary_papers = get_paper_links(self.airtable, variables[secondary_pos], 'title', True)
+        secondary_pos = self.secondary_papers_page_pos
+        secondary_papers = get_paper_links(self.papers_airtable, self.papers_by_id, variables[secondary_pos], 'title', True)
         variables[secondary_pos] = make_bullets(secondary_papers)
 
         keys = self.placeholders
@@ -470,53 +1031,60 @@ class ToolTable(Table):
 
         # perform the replacements of placeholders with data for a given record and insert it into
         # the locations defined in the page template
-        tool_page = reduce(lambda a, kv: a.replace(*kv, 1), replacements, self.dw_page_template)
+        tool_page = fill_template(self.dw_page_template, replacements)
         return tool_page
 
     def set_pages(self):
-        # create pages only for the records in which 'Wiki?' is true
-        relevant_records = []
-        for record in self.records:
-            if 'Wiki?' in record['fields']:
-                relevant_records.append(record)
-        new_pages = self.format_pages(relevant_records)
-        # this has to be done with a break of at least 5s
-        for page in new_pages:
-            self.wiki.pages.set(page, new_pages[page])
-            time.sleep(5)
+        # create pages only for the records in which 'Wiki?' is true; the
+        # filter feeds iter_pages lazily instead of building a filtered list
+        relevant_records = (r for r in self.records if 'Wiki?' in r['fields'])
+        batcher = PageBatcher(self.wiki)
+        for page_name, page in self.iter_pages(relevant_records):
+            batcher.submit(page_name, page)
+        batcher.close()
 
 
 class FtseTable(Table):
+    included_in = 'iifwiki:employee_giving_schemes'
+    main_column = 'Company'
+    root_namespace = 'companies:'
+    dw_page_name_column = 'Company'
+
     def __init__(self, wiki, base_name, table_name, user_key, company_group):
         super(FtseTable, self).__init__(wiki, base_name, table_name, user_key)
-        self.airtable = at.Airtable(base_name, table_name, user_key)
-        self.records = self.airtable.get_all()
-        self.included_in = 'iifwiki:employee_giving_schemes'
-        self.main_column = 'Company'
         self.columndefs = self.tabledefs['Giving_companies']
+        self.company_group = company_group  # (str) use this to differentiate between FTSE companies and other
+        self.records = self.fetch_own_records()
         self.header = self.construct_header(self.columndefs)
         self.placeholders = self.construct_placeholders(self.columndefs)
-        self.linked_pages = True
-        self.root_namespace = 'companies:'
         self.dw_page_template = wiki.pages.get(self.root_namespace + 'pagetemplate')
-        self.dw_page_name_column = 'Company'
-        self.company_group = company_group  # (str) use this to differentiate between FTSE companies and other
         self.dw_table_page = 'tables:employee_giving_schemes_' + self.company_group
-
-    def format_table(self, page_length=None):
-        table_content = '<datatables page-length="50">\n'
-        # initialize table content with the header
-        table_content += self.header
-        # construct the rows for all available records using the corresponding constructor function
+        # column positions the page builder indexes into, resolved once
+        self.fee_page_pos = self.columndefs['Pays PG fees']['page']['pos'] - 1
+        self.links_page_pos = self.columndefs['Other links']['page']['pos'] - 1
+
+    def fetch_own_records(self, refresh=False):
+        # each instance serves one company group, so let Airtable drop the
+        # other group's rows (and unnamed ones) instead of downloading and
+        # refiltering them here
+        return self.fetch_records(
+            ('Company group', 'Modified'),
+            formula="AND({{Company group}} = '{}', NOT({{Company}} = BLANK()))".format(self.company_group),
+            refresh=refresh)
+
+    def iter_rows(self):
         for record in self.records:
+            fields = record['fields']
             # we only consider records in which the main column is not empty
-            if (self.main_column is not None) and (self.main_column not in record['fields'])\
-                    and record['fields']['Company group'] != self.company_group:
-                pass
-            else:
-                table_content += self.automatic_construct_row(record)
-        table_content += '</datatables>\n'
-        return table_content
+            if (self.main_column is not None) and (self.main_column not in fields)\
+                    and fields['Company group'] != self.company_group:
+                continue
+            yield self.automatic_construct_row(record)
+
+    def format_table(self, page_length=None):
+        return "".join(chain(['<datatables page-length="50">\n', self.header],
+                             self.iter_rows(),
+                             ['</datatables>\n']))
 
     def create_page(self, record):
         """
@@ -526,10 +1094,10 @@ class FtseTable(Table):
         """
         variables = self.fetch_row(self.columndefs, record, target_format="page")
 
-        fee_pos = self.columndefs['Pays PG fees']['page']['pos']-1
+        fee_pos = self.fee_page_pos
         variables[fee_pos] = variables[fee_pos] + " Note: This field needs more research."
 
-        link_pos = self.columndefs['Other links']['page']['pos']-1
+        link_pos = self.links_page_pos
         if len(variables[link_pos]) > 0:
             sources = record['fields']['Other links'].split("; ")
             sources = [s.strip() for s in sources]
@@ -539,37 +1107,132 @@ class FtseTable(Table):
         keys = self.placeholders
         replacements = tuple(zip(keys, variables))
 
-        ftse_page = reduce(lambda a, kv: a.replace(*kv, 1), replacements, self.dw_page_template)
+        ftse_page = fill_template(self.dw_page_template, replacements)
         return ftse_page
 
     def set_pages(self):
-        relevant_records = []
-        for record in self.records:
-            if record['fields']['Company group'] == self.company_group:
-                relevant_records.append(record)
-        new_pages = self.format_pages(relevant_records)
-        # this has to be done with a break of at least 5s
-        for page in new_pages:
-            self.wiki.pages.set(page, new_pages[page])
-            time.sleep(10)
+        relevant_records = (r for r in self.records if r['fields']['Company group'] == self.company_group)
+        # company pages are heavier, so give the wiki a smaller write budget
+        batcher = PageBatcher(self.wiki, calls=15)
+        for page_name, page in self.iter_pages(relevant_records):
+            batcher.submit(page_name, page)
+        batcher.close()
+
+
+# per-publication-type reference builders, dispatched by entry type the same
+# way value_formatters dispatches by column type; each returns the formatted
+# reference plus the type-specific Airtable fields to write back
+def _article_reference(entry_fields, authors, year, title):
+    # Author, N. (year). Title. Journal Name, Vol, Num, Pages.
+    journal = clean_journal_name(entry_fields['journal'])
+    volume = entry_fields.get('volume', '')
+    number = entry_fields.get('number', '')
+    pages = entry_fields.get('pages', '')
+    reference = '{}, ({}). {}. {}, {}, {}, {}.'.format(authors, year, title, journal, volume, number, pages)
+    return reference, {'Journal': journal, 'Vol': volume, 'Num': number, 'Pages': pages}
+
+
+def _incollection_reference(entry_fields, authors, year, title):
+    # Author, N. (year). Chapter title, Pages. In: Book title.
+    # title() lowercases non-initial letters itself, no lower() pass needed
+    book = entry_fields['booktitle'].title()
+    pages = entry_fields.get('pages', '')
+    reference = '{}, ({}). {}, {}. In: {}.'.format(authors, year, title, pages, book)
+    return reference, {'Book_title': book, 'Pages': pages}
+
+
+def _techreport_reference(entry_fields, authors, year, title):
+    # Author, N. (year). Title. Institution.
+    institution = entry_fields.get('institution', '')
+    reference = '{}, ({}). {}. {}.'.format(authors, year, title, institution)
+    return reference, {'Institution': institution}
+
+
+def _plain_reference(entry_fields, authors, year, title):
+    # nothing to add for book and misc
+    # Author, N. (year). Title.
+    return '{}, ({}). {}.'.format(authors, year, title), {}
+
+
+reference_builders = {
+    'article': _article_reference,
+    'incollection': _incollection_reference,
+    'techreport': _techreport_reference,
+}
+
+# collapsed meta-analysis block appended to every paper page; built once at
+# import instead of being reassembled inside make_meta for every record
+meta_template ='<button collapse="meta">Meta-analysis data</button><collapse id="meta" ' \
+                'collapsed="true"><well>'\
+                '<WRAP third column>' \
+                '**Study year**: {r01}\n\n' \
+                '**Data link**: {r02}\n\n' \
+                '**Peer reviewed**: {r03}\n\n' \
+                '**Journal rating**: {r04}\n\n' \
+                '**Citations**: {r05}\n\n' \
+                '**Replications**: {r06}\n\n' \
+                '**Replication success**: {r07}\n\n' \
+                '**Pre-registered**: {r08}\n\n' \
+                '**Verified**: {r09}\n\n' \
+                '**Participants aware**: {r10}\n\n' \
+                '**Demographics**: {r11}\n\n' \
+                '</WRAP>' \
+                '<WRAP third column>' \
+                '**Design**: {r12}\n\n' \
+                '**Simple comparison**: {r13}\n\n' \
+                '**Sample size**: {r14}\n\n' \
+                '**Share treated**: {r15}\n\n' \
+                '**Key components**: {r16}\n\n' \
+                '**Main treatment**: {r17}\n\n' \
+                '**Mean donation**: {r18}\n\n' \
+                '**SD donation**: {r19}\n\n' \
+                '**Endowment amount**: {r20}\n\n' \
+                '**Endowment description**: {r21}\n\n' \
+                '**Currency**: {r22}\n\n' \
+                '</WRAP>' \
+                '<WRAP third column>' \
+                '**Conversion rate**: {r23}\n\n' \
+                '**Effect size original**: {r24}\n\n' \
+                '**Effect size USD**: {r25}\n\n' \
+                '**SE effect size**: {r26}\n\n' \
+                '**SE calculation**: {r27}\n\n' \
+                '**Effect size share**: {r28}\n\n' \
+                '**Mean incidence**: {r29}\n\n' \
+                '**Effect size incidence**: {r30}\n\n' \
+                '**Headline p-val**: {r31}\n\n' \
+                '**P-val description**: {r32}\n\n' \
+                '</WRAP>' \
+                '</well></collapse>'
 
 
 class PapersTable(Table):
+    dw_table_page = 'tables:papers'
+    included_in = 'papers:papers'
+    main_column = 'parencite'
+    root_namespace = 'papers:'
+    dw_page_name_column = 'Title'
 
     def __init__(self, wiki, base_name, table_name, user_key):
         super(PapersTable, self).__init__(wiki, base_name, table_name, user_key)
-        self.airtable = at.Airtable(base_name, table_name, user_key)
-        self.records = self.airtable.get_all()
-        self.dw_table_page = 'tables:papers'
-        self.included_in = 'papers:papers'
-        self.main_column = 'parencite'
+        # related-tool links resolve against the Tools table, not this one
+        self.tools_airtable = get_airtable(base_name, 'Tools', user_key)
         self.columndefs = self.tabledefs['papers_mass_qualitative']
+        self.records = self.fetch_own_records()
         self.header = self.construct_header(self.columndefs)
         self.placeholders = self.construct_placeholders(self.columndefs)
-        self.linked_pages = True
-        self.root_namespace = 'papers:'
         self.dw_page_template = wiki.pages.get(self.root_namespace + 'pagetemplate')
-        self.dw_page_name_column = 'Title'
+        # column positions the row and page builders index into, resolved once
+        self.tools_table_pos = self.columndefs['tools']['table']['pos'] - 1
+        self.tools_page_pos = self.columndefs['tools']['page']['pos'] - 1
+        self.meta_page_pos = self.columndefs['meta']['page']['pos'] - 1
+        # record updates queued by update_record until flush_updates sends them
+        self._pending_updates = []
+
+    def fetch_own_records(self, refresh=False):
+        # the meta-analysis well on paper pages reads the quantitative columns,
+        # and update_record needs the doi/bibtex source fields
+        return self.fetch_records(tuple(self.tabledefs['papers_mass_quantitative'])
+                                  + ('doi', 'bibtexfull', 'Modified'), refresh=refresh)
 
     def automatic_construct_row(self, record):
         """
@@ -579,8 +1242,8 @@ class PapersTable(Table):
         """
         row = self.fetch_row(self.columndefs, record)
         # related tools will also link to their pages, so we need to create those links
-        tool_pos = self.columndefs['tools']['table']['pos'] - 1
-        related_tools = get_tool_links(self.airtable, row[tool_pos])
+        tool_pos = self.tools_table_pos
+        related_tools = get_tool_links(self.tools_airtable, row[tool_pos])
         row[tool_pos] = ', '.join(related_tools)
         formatted_row = "| " + " | ".join(row) + " |\n"
 
@@ -588,7 +1251,7 @@ class PapersTable(Table):
 
     def set_table_page(self):
         new_page = self.format_table(page_length=100)
-        self.wiki.pages.set(self.dw_table_page, new_page)
+        set_page_if_changed(self.wiki, self.dw_table_page, new_page)
 
     def create_page(self, record):
         """
@@ -598,226 +1261,198 @@ class PapersTable(Table):
         """
         variables = self.fetch_row(self.columndefs, record, target_format="page")
 
-        tool_pos = self.columndefs['tools']['page']['pos'] - 1
-        related_tools = get_tool_links(self.airtable, variables[tool_pos])
+        tool_pos = self.tools_page_pos
+        related_tools = get_tool_links(self.tools_airtable, variables[tool_pos])
         variables[tool_pos] = ', '.join(related_tools)
 
-        meta_pos = self.columndefs['meta']['page']['pos'] - 1
+        meta_pos = self.meta_page_pos
         variables[meta_pos] = self.make_meta(record)
 
         keys = self.placeholders
         replacements = tuple(zip(keys, variables))
-        paper_page = reduce(lambda a, kv: a.replace(*kv, 1), replacements, self.dw_page_template)
+        paper_page = fill_template(self.dw_page_template, replacements)
 
         return paper_page
 
     def update_record(self, record):
+        fields = record['fields']
+        # collect all new field values first and write them back in a single
+        # update call, instead of one HTTP round trip per field
+        updates = {}
         # if doi present
-        if 'doi' in record['fields']:
-            doi = record['fields']['doi']
+        if 'doi' in fields:
+            doi = fields['doi']
 
             # fill in bibtex
             bib = dr.doi2bib(doi)
-            self.airtable.update(record['id'], {'bibtexfull': bib})
+            updates['bibtexfull'] = bib
 
             # fill in citation count
             citations = dr.doi2count(doi)
-            self.airtable.update(record['id'], {'num_citations': int(citations)})
+            updates['num_citations'] = int(citations)
 
             # fill in bibliographic information
-            self.fill_bibliography(record)
+            updates.update(self.fill_bibliography(record, bib))
 
-        elif 'bibtexfull' in record['fields']:
+        elif 'bibtexfull' in fields:
             # fill in bibliographic information
-            self.fill_bibliography(record)
+            updates.update(self.fill_bibliography(record, fields['bibtexfull']))
 
         else:
             print("This paper record has neither doi nor bibtex specified.")
-            pass
-        time.sleep(5)
 
-    def fill_bibliography(self, record):
-        bib_string = record['fields']['bibtexfull']
+        if len(updates) > 0:
+            # queue the write; full batches of 10 (the Airtable request limit)
+            # go out as one batch_update request instead of 10 single PATCHes
+            self._pending_updates.append({'id': record['id'], 'fields': updates})
+            if len(self._pending_updates) >= 10:
+                self.flush_updates()
+
+    def flush_updates(self):
+        """Send any queued record updates in one batch request.
+        Callers driving update_record in a loop must call this at the end to
+        push the final partial batch."""
+        if len(self._pending_updates) == 0:
+            return
+        self.airtable.batch_update(self._pending_updates)
+        self._pending_updates = []
+        # the records were rewritten remotely, so any cached copies are stale
+        get_record.cache_clear()
+        get_table_index.cache_clear()
+        clear_airtable_cache()
+
+    def fill_bibliography(self, record, bib_string):
+        """Parse a bibtex string and collect the bibliographic field values.
+        The bibtex is passed in rather than read from the record, so the doi
+        path can hand over the string it just resolved instead of relying on
+        a remote write having landed.
+
+        Args:
+            record: which record the bibliography is for
+            bib_string: full bibtex entry for the paper
+
+        Returns:
+            dict: field values keyed by Airtable column names
+
+        """
+        record_fields = record['fields']
+        updates = {}
 
         # fill in citation data
         parser = bibtex.Parser()
         bib_data = parser.parse_string(bib_string)
-        k = bib_data.entries.keys()[0]
-        print(k)
-        bib_type = bib_data.entries[k].type
-        self.airtable.update(record['id'], {'Publication_type': bib_type})
-
-        authors_list = [p.__str__() for p in bib_data.entries[k].persons['author']]
+        # bind the single entry and its fields/persons once instead of
+        # re-resolving bib_data.entries[k] chains on every read
+        entry = next(iter(bib_data.entries.values()))
+        print(entry.key)
+        bib_type = entry.type
+        entry_fields = entry.fields
+        authors_persons = entry.persons['author']
+        updates['Publication_type'] = bib_type
+
+        authors_list = [p.__str__() for p in authors_persons]
         authors = "; ".join(authors_list)
-        year = bib_data.entries[k].fields.get('year', '')
-        title = bib_data.entries[k].fields['title']
+        year = entry_fields.get('year', '')
+        title = entry_fields['title']
 
-        link = record['fields'].get('URL', '')
+        link = record_fields.get('URL', '')
 
         if link == '':
             title = '//{}//'.format(title)
         else:
             title = '//[[{}|{}]]//'.format(link, title)
 
-        self.airtable.update(record['id'], {'Authors': authors})
-        self.airtable.update(record['id'], {'Year': year})
-        self.airtable.update(record['id'], {'Title': title})
-
-        if bib_type == "article":
-            # Author, N. (year). Title. Journal Name, Vol, Num, Pages.
-            journal = bib_data.entries[k].fields['journal']
-            journal = journal.translate(bibtex_translator).lower().title()
-            volume = bib_data.entries[k].fields.get('volume', '')
-            number = bib_data.entries[k].fields.get('number', '')
-            pages = bib_data.entries[k].fields.get('pages', '')
-            reference = '{}, ({}). {}. {}, {}, {}, {}.'.format(authors, year, title, journal, volume, number, pages)
-
-            self.airtable.update(record['id'], {'Journal': journal})
-            self.airtable.update(record['id'], {'Vol': volume})
-            self.airtable.update(record['id'], {'Num': number})
-            self.airtable.update(record['id'], {'Pages': pages})
-
-        elif bib_type == "incollection":
-            # Author, N. (year). Chapter title, Pages. In: Book title.
-            book = bib_data.entries[k].fields['booktitle']
-            book = book.lower().title()
-            pages = bib_data.entries[k].fields.get('pages', '')
-            reference = '{}, ({}). {}, {}. In: {}.'.format(authors, year, title, pages, book)
-
-            self.airtable.update(record['id'], {'Book_title': book})
-            self.airtable.update(record['id'], {'Pages': pages})
-
-        elif bib_type == "techreport":
-            # Author, N. (year). Title. Institution.
-            institution = bib_data.entries[k].fields.get('institution', '')
-            reference = '{}, ({}). {}. {}.'.format(authors, year, title, institution)
-
-            self.airtable.update(record['id'], {'Institution': institution})
-
-        else:
-            # nothing to add for book and misc
-            # Author, N. (year). Title.
-            reference = '{}, ({}). {}.'.format(authors, year, title)
+        updates['Authors'] = authors
+        updates['Year'] = year
+        updates['Title'] = title
 
-        self.airtable.update(record['id'], {'Reference': reference})
+        builder = reference_builders.get(bib_type, _plain_reference)
+        reference, type_fields = builder(entry_fields, authors, year, title)
+        updates.update(type_fields)
+        updates['Reference'] = reference
 
         # create parencite
-        first_author = bib_data.entries[k].persons['author'][0].last_names[0]
+        first_author = authors_persons[0].last_names[0]
 
         if len(authors_list) == 0:
             parencite = ""
         elif len(authors_list) == 1:
             parencite = "({}, '{})".format(first_author, year[-2:])
         elif len(authors_list) == 2:
-            second_author = bib_data.entries[k].persons['author'][1].last_names[0]
+            second_author = authors_persons[1].last_names[0]
             parencite = "({} & {}, '{})".format(first_author, second_author[0], year[-2:])
         else:
             parencite = "({} ea, '{})".format(first_author, year[-2:])
 
-        self.airtable.update(record['id'], {'parencite': parencite})
+        updates['parencite'] = parencite
 
-    def make_meta(self, record):
-        meta_template = '<button collapse="meta">Meta-analysis data</button><collapse id="meta" ' \
-                        'collapsed="true"><well>'\
-                        '<WRAP third column>' \
-                        '**Study year**: R01\n\n' \
-                        '**Data link**: R02\n\n' \
-                        '**Peer reviewed**: R03\n\n' \
-                        '**Journal rating**: R04\n\n' \
-                        '**Citations**: R05\n\n' \
-                        '**Replications**: R06\n\n' \
-                        '**Replication success**: R07\n\n' \
-                        '**Pre-registered**: R08\n\n' \
-                        '**Verified**: R09\n\n' \
-                        '**Participants aware**: R10\n\n' \
-                        '**Demographics**: R11\n\n' \
-                        '</WRAP>' \
-                        '<WRAP third column>' \
-                        '**Design**: R12\n\n' \
-                        '**Simple comparison**: R13\n\n' \
-                        '**Sample size**: R14\n\n' \
-                        '**Share treated**: R15\n\n' \
-                        '**Key components**: R16\n\n' \
-                        '**Main treatment**: R17\n\n' \
-                        '**Mean donation**: R18\n\n' \
-                        '**SD donation**: R19\n\n' \
-                        '**Endowment amount**: R20\n\n' \
-                        '**Endowment description**: R21\n\n' \
-                        '**Currency**: R22\n\n' \
-                        '</WRAP>' \
-                        '<WRAP third column>' \
-                        '**Conversion rate**: R23\n\n' \
-                        '**Effect size original**: R24\n\n' \
-                        '**Effect size USD**: R25\n\n' \
-                        '**SE effect size**: R26\n\n' \
-                        '**SE calculation**: R27\n\n' \
-                        '**Effect size share**: R28\n\n' \
-                        '**Mean incidence**: R29\n\n' \
-                        '**Effect size incidence**: R30\n\n' \
-                        '**Headline p-val**: R31\n\n' \
-                        '**P-val description**: R32\n\n' \
-                        '</WRAP>' \
-                        '</well></collapse>'
+        return updates
 
+    def make_meta(self, record):
+        # substituting with format_map fills all 32 slots in one pass over the
+        # template, instead of the old reduce over 32 sequential str.replace
+        # calls that each rescanned the whole string
         variables = self.fetch_row(self.tabledefs['papers_mass_quantitative'], record)
         # we don't need the reference column here
         variables = variables[1:]
-        keys = ['R0' + str(i) for i in range(1, 10)] + ['R' + str(i) for i in range(10, 33)]
-
-        replacements = tuple(zip(keys, variables))
-        meta_well = reduce(lambda a, kv: a.replace(*kv, 1), replacements, meta_template)
-        return meta_well
+        mapping = {'r{:02d}'.format(i): v for i, v in enumerate(variables, 1)}
+        return meta_template.format_map(mapping)
 
 
 class MetaAnalysisTable(Table):
+    dw_table_page = 'tables:meta'
+    included_in = 'papers:meta_analysis'
+    main_column = 'parencite'
+    linked_pages = False
 
     def __init__(self, wiki, base_name, table_name, user_key):
         super(MetaAnalysisTable, self).__init__(wiki, base_name, table_name, user_key)
-        self.airtable = at.Airtable(base_name, table_name, user_key)
-        self.records = self.airtable.get_all()
-        self.dw_table_page = 'tables:meta'
-        self.included_in = 'papers:meta_analysis'
-        self.main_column = 'parencite'
         self.columndefs = self.tabledefs['papers_mass_quantitative']
         self.header = self.construct_header(self.columndefs)
-        self.linked_pages = False
 
     def set_table_page(self):
         new_page = self.format_table(page_length=100)
-        self.wiki.pages.set(self.dw_table_page, new_page)
+        set_page_if_changed(self.wiki, self.dw_table_page, new_page)
 
 
 class CategoryTable(Table):
+    dw_table_page = 'tables:tool_categories'
+    included_in = 'tools:tool_categories'
+    main_column = '(Sub)Category or theme'
+    linked_pages = False
+
     def __init__(self, wiki, base_name, table_name, user_key):
         super(CategoryTable, self).__init__(wiki, base_name, table_name, user_key)
-        self.airtable = at.Airtable(base_name, table_name, user_key)
-        self.records = self.airtable.get_all()
-        self.dw_table_page = 'tables:tool_categories'
-        self.included_in = 'tools:tool_categories'
-        self.main_column = '(Sub)Category or theme'
         self.columndefs = self.tabledefs[table_name]
         self.header = self.construct_header(self.columndefs)
-        self.linked_pages = False
 
     def set_table_page(self):
         new_page = self.format_table(page_length=100)
-        self.wiki.pages.set(self.dw_table_page, new_page)
+        set_page_if_changed(self.wiki, self.dw_table_page, new_page)
 
 
 class ExperienceTable(Table):
+    dw_table_page = 'tables:experiences_of_workplace_activists'
+    included_in = 'iifwiki:experiences_of_workplace_activists'
+    main_column = 'Name'
+    linked_pages = False
 
     def __init__(self, wiki, base_name, table_name, user_key):
         super(ExperienceTable, self).__init__(wiki, base_name, table_name, user_key)
-        self.airtable = at.Airtable(base_name, table_name, user_key)
-        self.records = self.airtable.get_all()
-        self.dw_table_page = 'tables:experiences_of_workplace_activists'
-        self.included_in = 'iifwiki:experiences_of_workplace_activists'
-        self.main_column = 'Name'
         self.columndefs = self.tabledefs[table_name]
-        default_header = self.construct_header(self.columndefs)
-        header = list(OrderedDict.fromkeys(default_header[3:-3].split(" ^ ")))
-        self.header = "\n^ " + " ^ ".join(header) + " ^\n"
-        self.linked_pages = False
+        # the deduplicated header is constant for the class, so parse it out
+        # of the default header once and keep it as the class attribute the
+        # other per-table constants already live in
+        if 'header' not in ExperienceTable.__dict__:
+            default_header = self.construct_header(self.columndefs)
+            header = list(OrderedDict.fromkeys(default_header[3:-3].split(" ^ ")))
+            ExperienceTable.header = "\n^ " + " ^ ".join(header) + " ^\n"
+        # row indices of the columns automatic_construct_row rearranges,
+        # resolved once here instead of chasing columndefs dicts per record
+        self._pos = {name: self.columndefs[name]['table']['pos'] - 1
+                     for name in ('Name', 'Role', 'Organisation', 'Organisation type',
+                                  'Number of employees', 'Choice motivation', 'Communication channel',
+                                  'Main arguments', 'Problems faced', 'Evaluation', 'Comments')}
 
     def automatic_construct_row(self, record):
         """
@@ -826,72 +1461,61 @@ class ExperienceTable(Table):
         :return: a formatted row for DW
         """
         row = self.fetch_row(self.columndefs, record)
+        pos = self._pos
 
         concise_row = list()
-        concise_row.append(row[self.columndefs['Name']['table']['pos']-1] + ", " +
-                           row[self.columndefs['Role']['table']['pos']-1])
-        concise_row.append(row[self.columndefs['Organisation']['table']['pos']-1] + ", " +
-                           row[self.columndefs['Organisation type']['table']['pos']-1])
-        emp_pos = self.columndefs['Number of employees']['table']['pos']-1
-        motiv_pos = self.columndefs['Choice motivation']['table']['pos']-1
-        concise_row.extend(row[emp_pos:motiv_pos])
-
-        comm_pos = self.columndefs['Communication channel']['table']['pos']-1
-        arg_pos = self.columndefs['Main arguments']['table']['pos'] - 1
-        prob_pos = self.columndefs['Problems faced']['table']['pos'] - 1
-        eval_pos = self.columndefs['Evaluation']['table']['pos'] - 1
-        inf_pos = self.columndefs['Comments']['table']['pos'] - 1
-
-        results = "**Choice motivation**: " + row[motiv_pos] + "\\\\ " +\
-                  "**Communication channel**: " + row[comm_pos] + "\\\\ " +\
-                  "**Main arguments**: " + row[arg_pos] + "\\\\ " +\
-                  "**Problems faced**: " + row[prob_pos] + "\\\\ " +\
-                  "**Evaluation**: " + row[eval_pos] + "\\\\ " +\
-                  "**Additional information**: " + row[inf_pos]
+        concise_row.append(row[pos['Name']] + ", " + row[pos['Role']])
+        concise_row.append(row[pos['Organisation']] + ", " + row[pos['Organisation type']])
+        motiv_pos = pos['Choice motivation']
+        concise_row.extend(row[pos['Number of employees']:motiv_pos])
+
+        # one formatting pass builds the whole block, instead of a chain of +
+        # concatenations that each allocated and copied an intermediate string
+        results = ("**Choice motivation**: {}\\\\ "
+                   "**Communication channel**: {}\\\\ "
+                   "**Main arguments**: {}\\\\ "
+                   "**Problems faced**: {}\\\\ "
+                   "**Evaluation**: {}\\\\ "
+                   "**Additional information**: {}").format(
+            row[motiv_pos], row[pos['Communication channel']], row[pos['Main arguments']],
+            row[pos['Problems faced']], row[pos['Evaluation']], row[pos['Comments']])
 
         concise_row.append(results)
 
-        formatted_row = "| " + " | ".join(concise_row) + " |\n"
-        return formatted_row
+        return "| {} |\n".format(" | ".join(concise_row))
 
 
 class ExperimentTable(Table):
+    dw_table_page = 'tables:data_experiments'
+    included_in = 'iifwiki:dataexperiments'
+    main_column = 'Experiment'
+    linked_pages = False
 
     def __init__(self, wiki, base_name, table_name, user_key):
         super(ExperimentTable, self).__init__(wiki, base_name, table_name, user_key)
-        self.airtable = at.Airtable(base_name, table_name, user_key)
-        self.records = self.airtable.get_all()
-        self.dw_table_page = 'tables:data_experiments'
-        self.included_in = 'iifwiki:dataexperiments'
-        self.main_column = 'Experiment'
         self.columndefs = self.tabledefs[table_name]
         self.header = self.construct_header(self.columndefs)
-        self.linked_pages = False
 
 
 class ThirdSectorTable(Table):
+    dw_table_page = 'tables:third_sector_infrastructure_details'
+    included_in = 'iifwiki:third_sector_infrastructure_details'
+    main_column = 'Name'
+    linked_pages = False
 
     def __init__(self, wiki, base_name, table_name, user_key):
         super(ThirdSectorTable, self).__init__(wiki, base_name, table_name, user_key)
-        self.airtable = at.Airtable(base_name, table_name, user_key)
-        self.records = self.airtable.get_all()
-        self.dw_table_page = 'tables:third_sector_infrastructure_details'
-        self.included_in = 'iifwiki:third_sector_infrastructure_details'
-        self.main_column = 'Name'
         self.columndefs = self.tabledefs[table_name]
         self.header = self.construct_header(self.columndefs)
-        self.linked_pages = False
 
 
 class EffectiveCharities(Table):
+    dw_table_page = 'tables:effective_charities'
+    included_in = 'iifwiki:earatings'
+    main_column = 'charity_name'
+    linked_pages = False
 
     def __init__(self, wiki, base_name, table_name, user_key):
         super(EffectiveCharities, self).__init__(wiki, base_name, table_name, user_key)
-        self.airtable = at.Airtable(base_name, table_name, user_key)
-        self.records = self.airtable.get_all()
-        self.dw_table_page = 'tables:effective_charities'
-        self.included_in = 'iifwiki:earatings'
-        self.main_column = 'charity_name'
         self.columndefs = self.tabledefs[table_name]
         self.header = self.construct_header(self.columndefs)
-        self.linked_pages = False
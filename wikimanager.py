@@ -20,6 +20,23 @@ class WikiManager:
         defined_tables (list): a list of tables that have defined formats
 
     """
+    # registry of tables with defined formats: Airtable base, actual table name,
+    # Table class and extra constructor arguments, keyed by the name used on the
+    # command line. Adding a new table means adding one entry here.
+    table_registry = {
+        'Tools': ('appBzOSifwBqSuVfH', 'Tools', wikicontents.ToolTable, ()),
+        'Giving_companies_ftse': ('apprleNrkR7dTtW60', 'Giving_companies', wikicontents.FtseTable, ('FTSE100',)),
+        'Giving_companies_other': ('apprleNrkR7dTtW60', 'Giving_companies', wikicontents.FtseTable, ('Other',)),
+        'Charity_experiments': ('appBzOSifwBqSuVfH', 'Charity_experiments', wikicontents.ExperimentTable, ()),
+        'Experiences': ('appBzOSifwBqSuVfH', 'Experiences', wikicontents.ExperienceTable, ()),
+        'Third_sector': ('appBzOSifwBqSuVfH', 'Third_sector', wikicontents.ThirdSectorTable, ()),
+        'papers_mass_qualitative': ('appBzOSifwBqSuVfH', 'papers_mass', wikicontents.PapersTable, ()),
+        'papers_mass_quantitative': ('appBzOSifwBqSuVfH', 'papers_mass', wikicontents.MetaAnalysisTable, ()),
+        'Categories': ('appBzOSifwBqSuVfH', 'Categories', wikicontents.CategoryTable, ()),
+        'effective_charities_rated': ('appBzOSifwBqSuVfH', 'effective_charities_rated',
+                                      wikicontents.EffectiveCharities, ()),
+    }
+
     def __init__(self, version):
         """Instantiate a manager for a particular wiki version.
         This sets up a connection to the wiki, fetches Airtable API key and defines which tables
@@ -55,60 +72,10 @@ class WikiManager:
         Returns:
             Table object
         """
-        if table_name == 'Tools':
-            table_base = 'appBzOSifwBqSuVfH'
-            self.table = wikicontents.ToolTable(self.wiki, table_base, table_name, self.user_key)
-            self.used_table_name = table_name
-
-        elif table_name == 'Giving_companies_ftse':
-            table_base = 'apprleNrkR7dTtW60'
-            table_name = 'Giving_companies'
-            self.table = wikicontents.FtseTable(self.wiki, table_base, table_name, self.user_key, 'FTSE100')
-            self.used_table_name = table_name
-
-        elif table_name == 'Giving_companies_other':
-            table_base = 'apprleNrkR7dTtW60'
-            table_name = 'Giving_companies'
-            self.table = wikicontents.FtseTable(self.wiki, table_base, table_name, self.user_key, 'Other')
-            self.used_table_name = table_name
-
-        elif table_name == 'Charity_experiments':
-            table_base = 'appBzOSifwBqSuVfH'
-            self.table = wikicontents.ExperimentTable(self.wiki, table_base, table_name, self.user_key)
-            self.used_table_name = table_name
-
-        elif table_name == 'Experiences':
-            table_base = 'appBzOSifwBqSuVfH'
-            self.table = wikicontents.ExperienceTable(self.wiki, table_base, table_name, self.user_key)
-            self.used_table_name = table_name
-
-        elif table_name == 'Third_sector':
-            table_base = 'appBzOSifwBqSuVfH'
-            self.table = wikicontents.ThirdSectorTable(self.wiki, table_base, table_name, self.user_key)
-            self.used_table_name = table_name
-
-        elif table_name == 'papers_mass_qualitative':
-            table_base = 'appBzOSifwBqSuVfH'
-            table_name = 'papers_mass'
-            self.table = wikicontents.PapersTable(self.wiki, table_base, table_name, self.user_key)
-            self.used_table_name = table_name
-
-        elif table_name == 'papers_mass_quantitative':
-            table_base = 'appBzOSifwBqSuVfH'
-            table_name = 'papers_mass'
-            self.table = wikicontents.MetaAnalysisTable(self.wiki, table_base, table_name, self.user_key)
-            self.used_table_name = table_name
-
-        elif table_name == 'Categories':
-            table_base = 'appBzOSifwBqSuVfH'
-            self.table = wikicontents.CategoryTable(self.wiki, table_base, table_name, self.user_key)
-            self.used_table_name = table_name
-
-        elif table_name == 'effective_charities_rated':
-            table_base = 'appBzOSifwBqSuVfH'
-            self.table = wikicontents.EffectiveCharities(self.wiki, table_base, table_name, self.user_key)
-            self.used_table_name = table_name
-
+        if table_name in self.table_registry:
+            table_base, real_table_name, table_class, extra_args = self.table_registry[table_name]
+            self.table = table_class(self.wiki, table_base, real_table_name, self.user_key, *extra_args)
+            self.used_table_name = real_table_name
         else:
             table_base = 'appBzOSifwBqSuVfH'
             self.table = wikicontents.Table(self.wiki, table_base, table_name, self.user_key)
@@ -145,42 +112,57 @@ class WikiManager:
             print("This table does not have associated pages. Only the table has been created.")
 
     def update_table_source(self):
+        # update decisions key on live 'Modified' flags, so refetch past the
+        # on-disk snapshot the constructor may have been served
+        self.table.records = self.table.fetch_own_records(refresh=True)
         for record in self.table.records:
             if 'Modified' in record['fields']:
                 self.table.update_record(record)
+        # tables that queue their writes still hold a partial batch here
+        if hasattr(self.table, 'flush_updates'):
+            self.table.flush_updates()
 
     def update_table(self):
         """Re-generate a full table on the Wiki if any record in Airtable table has been modified.
         When done, reset the 'Modified' fields in the Airtable."""
+        self.table.records = self.table.fetch_own_records(refresh=True)
         modified_records = 0
         for record in self.table.records:
             if 'Modified' in record['fields']:
                 modified_records += 1
                 self.table.airtable.update(record['id'], {'Modified': False})
         if modified_records > 0:
+            # the snapshot written by the refetch still carries the old flags
+            wikicontents.clear_airtable_cache()
             self.table.set_table_page()
 
     def update_pages(self):
         """Re-generate the pages on Wiki associated with any records that have been modified in the Airtable.
         When done, reset the 'Modified' fields in the Airtable."""
+        self.table.records = self.table.fetch_own_records(refresh=True)
         modified_records = []
         for record in self.table.records:
             if 'Modified' in record['fields']:
                 modified_records.append(record)
                 self.table.airtable.update(record['id'], {'Modified': False})
         if len(modified_records) > 0:
+            # the snapshot written by the refetch still carries the old flags
+            wikicontents.clear_airtable_cache()
             self.table.records = modified_records
             self.table.set_pages()
 
     def update_table_pages(self):
         """Re-generate the full table on the Wiki if any record has been modified, as well as associated pages.
         When done, reset the 'Modified' fields in the Airtable."""
+        self.table.records = self.table.fetch_own_records(refresh=True)
         modified_records = []
         for record in self.table.records:
             if 'Modified' in record['fields']:
                 modified_records.append(record)
                 self.table.airtable.update(record['id'], {'Modified': False})
         if len(modified_records) > 0:
+            # the snapshot written by the refetch still carries the old flags
+            wikicontents.clear_airtable_cache()
             self.table.set_table_page()
             self.table.records = modified_records
             self.table.set_pages()